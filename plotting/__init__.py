@@ -1,4 +1,5 @@
 from pathlib import Path
 
 BIN_DIR = Path(__file__).parent.parent / 'bin'
-CM = 2.54 # centimeters to inches
\ No newline at end of file
+CM = 2.54 # centimeters to inches
+INCH_PER_CM = 1.0 / CM # inches per centimeter
\ No newline at end of file
@@ -1,11 +1,24 @@
+import functools
+import logging
 import matplotlib as mpl
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib.figure
+import matplotlib.font_manager
 
 from pathlib import Path
 
 from . import BIN_DIR
-from . import CM
+from . import INCH_PER_CM
+
+logger = logging.getLogger(__name__)
+
+_UNIT_TO_INCH = {'cm': INCH_PER_CM, 'inch': 1.0} # figure size units to inches
+
+_FONT_EXTENSIONS = frozenset({'.ttf', '.otf'}) # font files matplotlib can add
+
+# style arguments used by Plot.set_style (tick widths are added per call)
+_GRID_KW = dict(axis='y', color='C7', linestyle='--', lw=.8)
+_MAJOR_TICK = dict(which='major', direction='out', length=3)
+_MINOR_TICK = dict(which='minor', direction='out', length=2)
 
 class Plotting():
     def __init__(self) -> None:
@@ -19,19 +32,18 @@ class Plotting():
             medium: fontsize for medium text
             big: fontsize for big text
         """
-        mpl.rcParams.update()
-        if fontfamily is None:
-            fontfamily = 'Arial'
-        plt.rc('font', family=fontfamily)
-        plt.rc('font', size=medium)         # controls default text sizes
-        plt.rc('axes', titlesize=big)       # fontsize of the axes title
-        plt.rc('axes', labelsize=medium)    # fontsize of the x and y labels
-        plt.rc('xtick', labelsize=small)    # fontsize of the tick labels
-        plt.rc('ytick', labelsize=small)    # fontsize of the tick labels
-        plt.rc('legend', fontsize=small)    # legend fontsize
-        plt.rc('savefig', dpi=300)          # figure resolution
-        plt.rc('pdf', fonttype=42)
-        plt.rc('ps', fonttype=42)
+        mpl.rcParams.update(_rc_params(fontfamily, small, medium, big))
+
+    def rc_context(self, fontfamily:str=None, small=8, medium=10, big=12):
+        """ get context manager that applies rc parameters only within its scope
+        args:
+            fontfamily: font family
+            small: fontsize for small text
+            medium: fontsize for medium text
+            big: fontsize for big text
+        returns: context manager (use with `with`)
+        """
+        return mpl.rc_context(_rc_params(fontfamily, small, medium, big))
 
     def get_figures(self, rows:int, cols:int, unit:str, figwidth:float, figheight:float, sharex=True,sharey=True):
         """ Get figure and axes object
@@ -43,57 +55,117 @@ class Plotting():
             figheight: figure height
             sharex: share x axis
         returns: figure object, axes object"""
-        if unit == 'cm':
-            figsize = (figwidth/CM, figheight/CM)
-        elif unit == 'inch':
-            figsize = (figwidth, figheight)
-        else:
-            raise ValueError(f'unit {unit} not supported')
+        try:
+            factor = _UNIT_TO_INCH[unit]
+        except KeyError:
+            raise ValueError(f'unit {unit} not supported') from None
+        figsize = (figwidth*factor, figheight*factor)
         plot = Plot(figsize=figsize)
-        axs = plot.subplots(nrows=rows, ncols=cols, sharex=sharex,sharey=sharey)
+        if rows == 1 and cols == 1:
+            # single axes: sharing is meaningless, skip the gridspec/array machinery
+            axs = plot.add_subplot(1, 1, 1)
+        else:
+            axs = plot.subplots(nrows=rows, ncols=cols, sharex=sharex,sharey=sharey)
         return plot, axs
 
     def _add_font(self):
         """ add custom fonts to matplotlib """
-        font_dirs = BIN_DIR / 'fonts'
-        font_files = mpl.font_manager.findSystemFonts(fontpaths=str(font_dirs))
+        _register_fonts(str(BIN_DIR / 'fonts'))
+
+
+@functools.lru_cache(maxsize=None)
+def _register_fonts(font_dir:str) -> None:
+    """ add fonts in font_dir to matplotlib, once per process and directory
+    args:
+        font_dir: directory to search for font files (recursively)
+    """
+    font_files = [f for f in Path(font_dir).rglob('*') if f.suffix.lower() in _FONT_EXTENSIONS]
+    registered = {f.fname for f in mpl.font_manager.fontManager.ttflist}
+
+    addfont = mpl.font_manager.fontManager.addfont
+    for font_file in font_files:
+        if str(font_file) in registered:
+            continue
+        logger.debug("Adding font: %s", font_file.stem)
+        addfont(str(font_file))
+
+
+def _rc_params(fontfamily:str=None, small=8, medium=10, big=12) -> dict:
+    """ build rc parameters for plots
+    args:
+        fontfamily: font family (or list of fallback families)
+        small: fontsize for small text
+        medium: fontsize for medium text
+        big: fontsize for big text
+    returns: dict of rc parameters
+    """
+    if fontfamily is None:
+        fontfamily = 'Arial'
+    return {
+        'font.family': fontfamily,
+        'font.size': medium,            # controls default text sizes
+        'axes.titlesize': big,          # fontsize of the axes title
+        'axes.labelsize': medium,       # fontsize of the x and y labels
+        'xtick.labelsize': small,       # fontsize of the tick labels
+        'ytick.labelsize': small,       # fontsize of the tick labels
+        'legend.fontsize': small,       # legend fontsize
+        'savefig.dpi': 300,             # figure resolution
+        'pdf.fonttype': 42,
+        'ps.fonttype': 42,
+    }
 
-        for font_file in font_files:
-            print("Adding font: ", font_file.split("\\")[-1].split(".")[0])
-            mpl.font_manager.fontManager.addfont(font_file)
-         
 
 class Plot(mpl.figure.Figure):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-    def set_style(self, offleft=5, offbottom=5, spinewidth=1.4) -> None:
+    def set_style(self, offleft=5, offbottom=5, spinewidth=1.4, skip_layout=False) -> None:
         """ set style for plots (despine, grid, ticks)
         args:
             offleft: offset left
             offbottom: offset bottom
             spinewidth: width of spines
+            skip_layout: do not call tight_layout (e.g. to call it once after plotting data)
         """
-        sns.despine(self,top=True, right=True, left=False, bottom=False, offset={'left': offleft, 'bottom': offbottom})
-
+        major = dict(_MAJOR_TICK, width=spinewidth)
+        minor = dict(_MINOR_TICK, width=spinewidth/2)
         for ax in self.axes:
-            ax.grid(axis='y', color='C7', linestyle='--', lw=.8)
-            ax.tick_params(which='major', direction='out', length=3, width=spinewidth, bottom=True, left=True)
-            ax.tick_params(which='minor', direction='out', length=2, width=spinewidth/2, bottom=True, left=True)
-            plt.setp(ax.spines.values(), linewidth=spinewidth)
-
-        self.tight_layout()
+            # despine: hide top/right, move left/bottom outward
+            spines = ax.spines
+            spines['top'].set_visible(False)
+            spines['right'].set_visible(False)
+            spines['left'].set_visible(True)
+            spines['bottom'].set_visible(True)
+            spines['left'].set_position(('outward', offleft))
+            spines['bottom'].set_position(('outward', offbottom))
+            xaxis, yaxis = ax.xaxis, ax.yaxis
+
+            ax.grid(**_GRID_KW)
+            xaxis.set_tick_params(bottom=True, **major)
+            yaxis.set_tick_params(left=True, **major)
+            xaxis.set_tick_params(bottom=True, **minor)
+            yaxis.set_tick_params(left=True, **minor)
+            for spine in spines.values():
+                spine.set_linewidth(spinewidth)
+
+        # constrained/tight layout engines already lay out the figure on draw
+        if not (skip_layout or self.get_constrained_layout() or self.get_tight_layout()):
+            self.tight_layout()
 
 
     def save(self, filename:str, path:Path=None, **kwargs) -> None:
         """ save figure
         args:
             filename: filename
-            path: path to save figure
+            path: path to save figure (default: current working directory)
+            kwargs: passed to savefig (dpi defaults to rcParams['savefig.dpi'], or 300 if that is unset)
         """
         if path is None:
-            path = Path.cwd()
-        self.savefig(path / filename, bbox_inches='tight',dpi=300, **kwargs) 
+            path = Path() # relative, resolved against the cwd when saving
+        defaults = {'bbox_inches': 'tight'}
+        if mpl.rcParams['savefig.dpi'] == 'figure': # matplotlib default, keep publication resolution
+            defaults['dpi'] = 300
+        self.savefig(path / filename, **{**defaults, **kwargs})
 
         
 
@@ -26,7 +26,6 @@ setup(
     python_requires='>=3.6',
     install_requires=[
         'matplotlib>=3.3.4',
-        'seaborn>=0.11.1',
     ],
     extras_require={
         'dev': [
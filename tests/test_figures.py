@@ -0,0 +1,81 @@
+import matplotlib
+matplotlib.use('Agg')
+
+import pytest
+from PIL import Image
+
+from plotting.figures import Plot, Plotting
+
+
+def test_rc_params_accept_font_family_list():
+    settings = Plotting()
+    families = ['Helvetica', 'DejaVu Sans']
+    with matplotlib.rc_context():
+        settings.set_rc_params(fontfamily=families)
+        assert matplotlib.rcParams['font.family'] == families
+    with settings.rc_context(fontfamily=families):
+        assert matplotlib.rcParams['font.family'] == families
+
+
+def test_set_style_restyles_after_clear():
+    plot, ax = Plotting().get_figures(rows=1, cols=1, unit='cm', figwidth=8, figheight=6)
+    plot.set_style(offleft=5, offbottom=5, spinewidth=1.4)
+
+    ax.clear()
+    assert ax.spines['left'].get_position() != ('outward', 5)
+
+    plot.set_style(offleft=5, offbottom=5, spinewidth=1.4)
+    assert ax.spines['left'].get_position() == ('outward', 5)
+    assert ax.spines['bottom'].get_position() == ('outward', 5)
+    assert not ax.spines['top'].get_visible()
+    assert not ax.spines['right'].get_visible()
+    assert all(gl.get_visible() for gl in ax.yaxis.get_gridlines())
+    assert ax.spines['left'].get_linewidth() == 1.4
+
+
+def _subplot_params(plot):
+    pars = plot.subplotpars
+    return (pars.left, pars.right, pars.bottom, pars.top, pars.wspace, pars.hspace)
+
+
+def test_set_style_skip_layout_keeps_subplot_params():
+    plot, ax = Plotting().get_figures(rows=2, cols=2, unit='cm', figwidth=10, figheight=8)
+    ax[1, 0].set_xlabel('x label')
+    before = _subplot_params(plot)
+    plot.set_style(skip_layout=True)
+    assert _subplot_params(plot) == before
+
+
+def test_set_style_keeps_constrained_layout():
+    plot = Plot(constrained_layout=True)
+    plot.add_subplot(1, 1, 1)
+    plot.set_style()
+    assert plot.get_constrained_layout()
+
+
+def test_set_style_runs_layout_after_explicit_tight_layout(monkeypatch):
+    plot, ax = Plotting().get_figures(rows=1, cols=1, unit='cm', figwidth=8, figheight=6)
+    plot.tight_layout()
+
+    calls = []
+    monkeypatch.setattr(plot, 'tight_layout', lambda *args, **kwargs: calls.append(args))
+    plot.set_style()
+    assert len(calls) == 1
+
+
+def _saved_dpi(tmp_path, rc_dpi, **kwargs):
+    plot, ax = Plotting().get_figures(rows=1, cols=1, unit='cm', figwidth=4, figheight=3)
+    with matplotlib.rc_context({'savefig.dpi': rc_dpi}):
+        plot.save('figure.png', path=tmp_path, **kwargs)
+    with Image.open(tmp_path / 'figure.png') as image:
+        return round(image.info['dpi'][0])
+
+
+@pytest.mark.parametrize('rc_dpi, kwargs, expected', [
+    ('figure', {}, 300),            # matplotlib default: keep publication resolution
+    (150, {}, 150),                 # global rc setting is respected
+    ('figure', {'dpi': 72}, 72),    # per-call dpi no longer raises TypeError
+    (150, {'dpi': 72}, 72),
+])
+def test_save_dpi(tmp_path, rc_dpi, kwargs, expected):
+    assert _saved_dpi(tmp_path, rc_dpi, **kwargs) == expected